@@ -1,17 +1,70 @@
+import ctypes
+import os
+import queue
 import re
 import shutil
 import string
-from typing import Generator, Optional, Callable
+import struct
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Generator, Iterable, Iterator, Optional, Callable, Sequence
 
 import pydicom
 from pathlib import Path
+from pydicom.datadict import tag_for_keyword
+from pydicom.dataelem import RawDataElement
+from pydicom.dataset import FileMetaDataset
+from pydicom.tag import BaseTag, Tag
 
 
 # Default file name structure for instance naming. Users can override this.
 DEFAULT_FILE_NAME_STRUCTURE: str = "{InstanceNumber}"
 
-
-def is_dicom(path: Path) -> bool:
+# Fixed folder structure used by sort_dicoms to separate every series (and irradiation event) into its own folder.
+# create_sort_folder resolves it directly from these tags, keep them in sync.
+SORT_FOLDER_STRUCTURE: str = "{SeriesInstanceUID}_{IrradiationEventUID}"
+_SERIES_INSTANCE_UID: BaseTag = Tag(0x0020, 0x000E)
+_IRRADIATION_EVENT_UID: BaseTag = Tag(0x0008, 0x3010)
+
+# Symbols replaced by an underscore in file and folder names by clean_text.
+DEFAULT_FORBIDDEN_SYMBOLS: frozenset[str] = frozenset({
+    # Windows-forbidden path characters.
+    '?', '<', '>', '\\', '/', '|', ':', '*', '"',
+    # Common punctuation.
+    '.', ',', '\'', '[', ']', ';', ' ',
+    # DICOM PersonName component separator.
+    '^',
+})
+_CLEAN_TABLE: dict[int, str] = str.maketrans(dict.fromkeys(DEFAULT_FORBIDDEN_SYMBOLS, '_'))
+_UNDERSCORES: re.Pattern[str] = re.compile(r'_+')
+
+# Explicit VR little endian element header: group, element, VR and (for most VRs) a 2-byte length.
+_ELEMENT_HEADER: struct.Struct = struct.Struct("<HH2sH")
+# VRs followed by 2 reserved bytes and a 4-byte length in explicit VR encoding.
+_LONG_LENGTH_VRS: frozenset[bytes] = frozenset({b"OB", b"OD", b"OF", b"OL", b"OV", b"OW", b"SQ", b"SV", b"UC", b"UN",
+                                                b"UR", b"UT", b"UV"})
+_UNDEFINED_LENGTH: int = 0xFFFFFFFF
+_SPECIFIC_CHARACTER_SET: int = 0x00080005
+_PIXEL_DATA: int = 0x7FE00010
+
+# Number of discovered files collected before they are handed on as one batch.
+_DISCOVERY_BATCH_SIZE: int = 1024
+
+# Maximum number of files handed to the save threads but not yet finished. Bounds memory while the source folder
+# is still being scanned.
+_MAX_PENDING_FILES: int = 256
+
+# Number of threads reading headers ahead of the main loop, and the maximum number of headers read ahead. Reading many
+# small files (e.g. from a network share) is latency-bound, so several reads in flight hide most of that latency.
+_HEADER_READ_THREADS: int = 16
+_HEADER_READ_AHEAD: int = 64
+
+
+def is_dicom(path: str | Path) -> bool:
     """Check if a file is DICOM file by checking for the "DICM" magic word at byte offset 128. This is a common
     heuristic, but not foolproof, as some DICOM files may not have this signature, and some non-DICOM files might
     coincidentally have it. For a more robust check, you might want to attempt reading the file with pydicom and catch
@@ -19,7 +72,7 @@ def is_dicom(path: Path) -> bool:
 
     Parameters
     ----------
-    path : Path
+    path : str | Path
         The path to the file to check.
 
     Returns
@@ -28,49 +81,297 @@ def is_dicom(path: Path) -> bool:
         True if the file is DICOM file, False otherwise.
     """
     try:
-        with open(path, "rb") as f:
-            f.seek(128)
-            return f.read(4) == b"DICM"
+        # Unbuffered: a single read of the preamble and the magic word, without a seek or a read buffer. This runs for
+        # every file in the source folder.
+        with open(path, "rb", buffering=0) as f:
+            return f.read(132)[128:] == b"DICM"
     except OSError:
         return False
 
 
-def find_dicoms_in_folder(folder: Path, function_check: Optional[Callable[[Path], bool]] = None) -> list[Path]:
-    """Recursively find all DICOM files in a folder.
+@dataclass
+class DiscoveredBatch:
+    """A batch of discovered files, stored column-wise: entry i of each list belongs to the same file."""
+    parents: list[str] = field(default_factory=list)
+    names: list[str] = field(default_factory=list)
+    sizes: array = field(default_factory=lambda: array("q"))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(self, parent: str, name: str, size: int) -> None:
+        """Add a file to the batch.
+
+        Parameters
+        ----------
+        parent : str
+            The folder containing the file.
+        name : str
+            The file name.
+        size : int
+            The file size in bytes.
+        """
+        self.parents.append(parent)
+        self.names.append(name)
+        self.sizes.append(size)
+
+    def sorted_by_locality(self) -> "DiscoveredBatch":
+        """Return a copy of the batch ordered by (parent folder, size).
+
+        Files of the same folder end up next to each other, which keeps the filesystem caches warm for that folder
+        (and, as one source folder is usually one series, for its destination folder as well).
+        """
+        order: list[int] = sorted(range(len(self)), key=lambda i: (self.parents[i], self.sizes[i]))
+        return DiscoveredBatch(parents=[self.parents[i] for i in order],
+                               names=[self.names[i] for i in order],
+                               sizes=array("q", (self.sizes[i] for i in order)))
+
+    def paths(self) -> Iterator[Path]:
+        """Yield the full path of every file in the batch."""
+        for parent, name in zip(self.parents, self.names):
+            yield Path(parent, name)
+
+    def path_strings(self) -> Iterator[str]:
+        """Yield the full path of every file in the batch, as a string. Cheaper than paths, for internal use."""
+        for parent, name in zip(self.parents, self.names):
+            yield os.path.join(parent, name)
+
+
+def find_dicom_batches(folder: Path, function_check: Optional[Callable[[Path], bool]] = None,
+                       batch_size: int = _DISCOVERY_BATCH_SIZE,
+                       exclude: Optional[str | Path] = None) -> Iterator[DiscoveredBatch]:
+    """Recursively find all DICOM files in a folder, in batches.
+
+    The folder tree is walked with os.scandir, which gets the entry type from the directory listing itself, so no
+    extra stat call is needed per entry (the file size needs one on most platforms other than Windows). Symbolic links
+    to folders are not followed. Folders that cannot be read are skipped, and so are entries that cannot be inspected.
+
+    Batches are yielded while the walk is still in progress, so callers can start working on them before the whole
+    tree has been scanned. Each batch is sorted by locality, see DiscoveredBatch.sorted_by_locality.
 
     Parameters
     ----------
     folder : Path
         The folder to search for DICOM files.
     function_check : Callable[[Path], bool], optional
-        A function that takes a Path and returns True if it is a DICOM file. If None, the default is to check for the
-        "DICM" magic word at byte offset 128.
+        A function that takes a file path and returns True if it is a DICOM file. If None, the default is to check for
+        the "DICM" magic word at byte offset 128.
+    batch_size : int, optional
+        The number of files per batch. The last batch may be smaller.
+    exclude : str | Path, optional
+        A folder to leave out, together with everything in it. Use this for a destination inside the folder: files are
+        written there while the walk is still in progress, and must not be found again. It is recognized by its
+        device and inode number, so it must exist when the walk starts.
 
-    Returns
-    -------
-    list[Path]
-        A list of Paths to the found DICOM files.
+    Yields
+    ------
+    DiscoveredBatch
+        The found DICOM files.
     """
+    # The default check works on the path string directly. A given check takes a Path, so it is only created for it.
     if function_check is None:
-        function_check = is_dicom
+        check: Callable[[str], bool] = is_dicom
+    else:
+        check = lambda path: function_check(Path(path))
+
+    excluded: Optional[os.stat_result] = None
+    if exclude is not None:
+        try:
+            excluded = os.stat(exclude)
+        except OSError:
+            pass  # It does not exist, so there is nothing in it to find.
+
+    batch: DiscoveredBatch = DiscoveredBatch()
+    pending: deque[str] = deque([os.fspath(folder)])
+    while pending:
+        current: str = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if excluded is None or not _is_same_folder(entry=entry, folder=excluded):
+                                pending.append(entry.path)
+                            continue
+                        if not (entry.is_file() and check(entry.path)):
+                            continue
+                        size: int = entry.stat().st_size
+                    except OSError:
+                        continue  # E.g. removed since the listing, only this entry is skipped.
+
+                    batch.append(parent=current, name=entry.name, size=size)
+                    if len(batch) >= batch_size:
+                        yield batch.sorted_by_locality()
+                        batch = DiscoveredBatch()
+        except OSError:
+            continue  # Unreadable folder, e.g. no permission.
+
+    if batch:
+        yield batch.sorted_by_locality()
+
+
+def _is_same_folder(entry: os.DirEntry, folder: os.stat_result) -> bool:
+    """Return whether a directory entry is the given folder.
+
+    On most platforms the inode number comes with the directory listing, so only a matching inode costs a stat call
+    (for the device number).
+    """
+    if entry.inode() != folder.st_ino:
+        return False
+    return entry.stat(follow_symlinks=False).st_dev == folder.st_dev
+
 
-    return [p for p in folder.rglob('*') if function_check(p)]
+def _resolved(path: str | Path) -> str:
+    """Return the absolute path with all symbolic links resolved, normalized for comparison on this platform."""
+    return os.path.normcase(os.path.realpath(path))
 
 
-def read_dicom_file(dicom_path: Path) -> pydicom.Dataset:
+def find_dicoms_in_folder(folder: Path, function_check: Optional[Callable[[Path], bool]] = None) -> Iterator[Path]:
+    """Recursively find all DICOM files in a folder.
+
+    Files are yielded while the walk is still in progress, so callers can start working on them before the whole tree
+    has been scanned. See find_dicom_batches for details.
+
+    Parameters
+    ----------
+    folder : Path
+        The folder to search for DICOM files.
+    function_check : Callable[[Path], bool], optional
+        A function that takes a file path and returns True if it is a DICOM file. If None, the default is to check for
+        the "DICM" magic word at byte offset 128.
+
+    Yields
+    ------
+    Path
+        The paths to the found DICOM files.
+    """
+    for batch in find_dicom_batches(folder=folder, function_check=function_check):
+        yield from batch.paths()
+
+
+def read_dicom_file(dicom_path: str | Path, *, specific_tags: Optional[Sequence[int]] = None,
+                    stop_before_pixels: bool = False, defer_size: Optional[int] = 1024) -> pydicom.Dataset:
     """Read a DICOM file and return the dataset.
 
     Parameters
     ----------
-    dicom_path : Path
+    dicom_path : str | Path
         The path to the DICOM file.
+    specific_tags : Sequence[int], optional
+        If given, only these tags are read (the file meta information is always read). Use this when only a few tags
+        are needed, e.g. to build a path. By default, all tags are read.
+    stop_before_pixels : bool, optional
+        Whether to stop reading before the pixel data, by default False.
+    defer_size : int, optional
+        Values larger than this number of bytes (e.g. the pixel data) are not read until they are accessed, by
+        default 1024. This keeps an open dataset small. Use None to read all values immediately.
 
     Returns
     -------
     pydicom.Dataset
         The DICOM dataset.
     """
-    return pydicom.dcmread(fp=dicom_path, force=True)
+    return pydicom.dcmread(fp=dicom_path, force=True, specific_tags=specific_tags,
+                           stop_before_pixels=stop_before_pixels, defer_size=defer_size)
+
+
+def read_header_tags(dicom_path: str | Path, tags: Sequence[int]) -> Optional[pydicom.Dataset]:
+    """Read a few top-level tags from a DICOM file with a minimal header scanner.
+
+    Only files with a "DICM" preamble and an explicit VR little endian data set (this includes all compressed transfer
+    syntaxes) are supported. The scanner walks the element headers, reads the values of the requested tags and seeks
+    past everything else. It stops as soon as it passes the highest requested tag, so it never touches the pixel data.
+    The values are kept as raw elements, so pydicom converts them exactly like it would after a full read.
+
+    Parameters
+    ----------
+    dicom_path : str | Path
+        The path to the DICOM file.
+    tags : Sequence[int]
+        The tags to read.
+
+    Returns
+    -------
+    pydicom.Dataset or None
+        A dataset with the requested tags that are present (and the file meta information), or None if the file is
+        not supported by the scanner. Use read_dicom_file in that case.
+    """
+    wanted: set[int] = {*tags, _SPECIFIC_CHARACTER_SET}  # The character set is needed to decode text values.
+    last: int = max(wanted)
+
+    file_meta: FileMetaDataset = FileMetaDataset()
+    dataset: pydicom.Dataset = pydicom.Dataset()
+    try:
+        with open(dicom_path, "rb") as f:
+            if f.read(132)[128:] != b"DICM":
+                return None
+
+            in_file_meta: bool = True
+            while True:
+                header: bytes = f.read(8)
+                if len(header) < 8:
+                    break  # End of the file.
+
+                group, element, vr, length = _ELEMENT_HEADER.unpack(header)
+                tag: int = group << 16 | element
+                if in_file_meta and group != 2:
+                    # End of the file meta information. Its transfer syntax decides how the data set is encoded.
+                    transfer_syntax = file_meta.get("TransferSyntaxUID")
+                    # A private transfer syntax (e.g. GE's 1.2.840.113619.5.2) has no known encoding.
+                    if (transfer_syntax is None or not transfer_syntax.is_transfer_syntax
+                            or transfer_syntax.is_implicit_VR
+                            or not transfer_syntax.is_little_endian or transfer_syntax.is_deflated):
+                        return None
+                    in_file_meta = False
+                if not in_file_meta and (tag > last or tag == _PIXEL_DATA):
+                    break  # Elements are sorted by tag, so all requested tags have been seen.
+                if not vr.isalpha() or not vr.isupper():
+                    return None  # Not explicit VR after all.
+
+                value_tell: int = f.tell()
+                if vr in _LONG_LENGTH_VRS:
+                    (length,) = struct.unpack("<L", f.read(4))
+                    value_tell += 4
+                if length == _UNDEFINED_LENGTH:
+                    return None  # E.g. a sequence of undefined length, which needs a real parser to skip.
+
+                if in_file_meta or tag in wanted:
+                    target: pydicom.Dataset = file_meta if in_file_meta else dataset
+                    target[Tag(tag)] = RawDataElement(Tag(tag), vr.decode("ascii"), length, f.read(length),
+                                                      value_tell, False, True)
+                else:
+                    f.seek(length, os.SEEK_CUR)
+    except (OSError, struct.error):
+        return None
+
+    if in_file_meta:
+        return None  # There was no data set at all.
+
+    dataset.file_meta = file_meta
+    return dataset
+
+
+def _read_header(dicom_path: str | Path, tags: Sequence[int]) -> pydicom.Dataset:
+    """Read the given tags from a DICOM file, without the pixel data.
+
+    Tries the fast header scanner first (read_header_tags) and falls back to pydicom for files it does not support.
+
+    Parameters
+    ----------
+    dicom_path : str | Path
+        The path to the DICOM file.
+    tags : Sequence[int]
+        The tags to read.
+
+    Returns
+    -------
+    pydicom.Dataset
+        A dataset containing (at least) the requested tags that are present in the file.
+    """
+    dataset: Optional[pydicom.Dataset] = read_header_tags(dicom_path=dicom_path, tags=tags)
+    if dataset is None:
+        dataset = read_dicom_file(dicom_path=dicom_path, specific_tags=tags, stop_before_pixels=True)
+    return dataset
 
 
 def clean_text(text: str, forbidden_symbols: set[str] = None) -> str:
@@ -84,7 +385,7 @@ def clean_text(text: str, forbidden_symbols: set[str] = None) -> str:
     text : str
         The text to clean.
     forbidden_symbols : set[str]
-        A set of symbols to replace with underscores. If None, a default set is used covering
+        A set of symbols to replace with underscores. If None, DEFAULT_FORBIDDEN_SYMBOLS is used, covering
         characters forbidden on Windows ('?', '<', '>', '\\', '/', '|', ':', '*', '"') plus
         common punctuation and DICOM-specific separators ('^' in PersonName, '.', ',', etc.).
 
@@ -94,18 +395,13 @@ def clean_text(text: str, forbidden_symbols: set[str] = None) -> str:
         The cleaned text, safe to use as a file or folder name component.
     """
     if forbidden_symbols is None:
-        forbidden_symbols = {
-            # Windows-forbidden path characters.
-            '?', '<', '>', '\\', '/', '|', ':', '*', '"',
-            # Common punctuation.
-            '.', ',', '\'', '[', ']', ';', ' ',
-            # DICOM PersonName component separator.
-            '^',
-        }
-
-    table = {ord(c): '_' for c in forbidden_symbols}
+        table = _CLEAN_TABLE  # Built once, this is by far the most common case.
+    else:
+        table = str.maketrans(dict.fromkeys(forbidden_symbols, '_'))
+
     cleaned = str(text).translate(table).lower()
-    cleaned = re.sub(r'_+', '_', cleaned)  # collapse consecutive underscores.
+    if '__' in cleaned:
+        cleaned = _UNDERSCORES.sub('_', cleaned)  # collapse consecutive underscores.
     return cleaned.strip('_')
 
 
@@ -128,36 +424,154 @@ def get_dicom_tag(dicom: pydicom.Dataset, key: str) -> str:
     return clean_text(dicom.get(key, "NA"))
 
 
-def _resolve_structure(dicom: pydicom.Dataset, structure: str) -> str:
+@lru_cache(maxsize=None)
+def _structure_keywords(structure: str) -> frozenset[str]:
+    """Return the DICOM keywords used as {Keyword} placeholders in a format string."""
+    return frozenset(fname for _, fname, _, _ in string.Formatter().parse(structure) if fname is not None)
+
+
+@lru_cache(maxsize=None)
+def _header_tags(*structures: str) -> tuple[int, ...]:
+    """Return the tags needed to resolve the given format strings, for use as specific_tags in read_dicom_file.
+
+    Keywords unknown to pydicom are left out: they always resolve to "NA".
+    """
+    keywords: set[str] = set().union(*(_structure_keywords(structure) for structure in structures))
+    return tuple(sorted(tag for tag in map(tag_for_keyword, keywords) if tag is not None))
+
+
+@lru_cache(maxsize=None)
+def _compile_structure(structure: str) -> Callable[[pydicom.Dataset], str]:
+    """Compile a format string with DICOM keyword placeholders into a function that resolves it for a dataset.
+
+    The format string is parsed only once per process. The returned function only looks up (by numeric tag) and
+    cleans the tags and joins them with the literal text in between. Placeholders with a conversion or format spec, e.g.
+    "{InstanceNumber:>4}", fall back to str.format.
+
+    Parameters
+    ----------
+    structure : str
+        A format string with DICOM keyword placeholders, e.g. "{PatientID}/{StudyDate}_{StudyDescription}".
+
+    Returns
+    -------
+    Callable[[pydicom.Dataset], str]
+        A function that returns the resolved string for a dataset.
+    """
+    parts = list(string.Formatter().parse(structure))
+
+    if any(spec or conversion or (fname is not None and not fname.isidentifier())
+           for _, fname, spec, conversion in parts):
+        keywords: frozenset[str] = _structure_keywords(structure)
+
+        def resolve(dicom: pydicom.Dataset) -> str:
+            return structure.format(**{key: clean_text(dicom.get(key, "NA")) for key in keywords})
+
+        return resolve
+
+    # Translate each keyword to its numeric tag once, so the lookup per file skips the keyword dictionary. Unknown
+    # keywords always resolve to "NA" and are folded into the literal text.
+    pieces: list[tuple[str, BaseTag | None]] = []
+    for literal, fname, _, _ in parts:
+        tag: int | None = None if fname is None else tag_for_keyword(fname)
+        if fname is not None and tag is None:
+            literal += clean_text("NA")
+        pieces.append((literal, None if tag is None else Tag(tag)))
+
+    if len(pieces) == 1 and not pieces[0][0] and pieces[0][1] is not None:
+        # A single placeholder, like the default "{InstanceNumber}": no joining needed.
+        single_tag: BaseTag = pieces[0][1]
+
+        def resolve(dicom: pydicom.Dataset) -> str:
+            element = dicom.get(single_tag)
+            return clean_text("NA" if element is None else element.value)
+
+        return resolve
+
+    def resolve(dicom: pydicom.Dataset) -> str:
+        # Same as get_dicom_tag, inlined: this runs for every file.
+        resolved: list[str] = []
+        for literal, tag in pieces:
+            if tag is None:
+                resolved.append(literal)
+            else:
+                element = dicom.get(tag)  # A DataElement, as the key is a tag and not a keyword.
+                resolved.append(literal + clean_text("NA" if element is None else element.value))
+        return "".join(resolved)
+
+    return resolve
+
+
+@dataclass(frozen=True)
+class CompiledStructure:
+    """A format string with DICOM keyword placeholders, parsed once. Calling it resolves it for a dataset."""
+    structure: str
+    tags: tuple[int, ...]
+    resolve: Callable[[pydicom.Dataset], str]
+
+    def __call__(self, dicom: pydicom.Dataset) -> str:
+        return self.resolve(dicom)
+
+
+@lru_cache(maxsize=None)
+def compile_structure(structure: str) -> CompiledStructure:
+    """Parse a format string with DICOM keyword placeholders once, for use in sort_dicoms or restructure_sorted_folders.
+
+    Passing the compiled structure instead of the format string saves looking up the parsed structure for every file.
+    An invalid format string, e.g. "{PatientID", raises here, before any file is touched.
+
+    Parameters
+    ----------
+    structure : str
+        A format string with DICOM keyword placeholders, e.g. "{PatientID}/{StudyDate}_{StudyDescription}".
+
+    Returns
+    -------
+    CompiledStructure
+        The compiled structure, together with the tags needed to resolve it.
+
+    Raises
+    ------
+    ValueError
+        If the format string is invalid.
+    """
+    return CompiledStructure(structure=structure, tags=_header_tags(structure), resolve=_compile_structure(structure))
+
+
+def _as_compiled(structure: str | CompiledStructure) -> CompiledStructure:
+    """Return the compiled version of a structure, compiling it if it is still a format string."""
+    return structure if isinstance(structure, CompiledStructure) else compile_structure(structure)
+
+
+def _resolve_structure(dicom: pydicom.Dataset, structure: str | CompiledStructure) -> str:
     """Resolve a format string by looking up the required DICOM tags dynamically.
 
     Parses all {Keyword} placeholders in structure, fetches each from the dataset
-    via get_dicom_tag, and returns the formatted result. Any valid DICOM keyword
-    can be used without pre-registration.
+    by its numeric tag, cleans it like get_dicom_tag would, and returns the formatted
+    result. Any valid DICOM keyword can be used without pre-registration. The parsed
+    structure is cached, see _compile_structure.
 
     Parameters
     ----------
     dicom : pydicom.Dataset
         The DICOM dataset.
-    structure : str
+    structure : str | CompiledStructure
         A format string with DICOM keyword placeholders, e.g.
-        "{PatientID}/{StudyDate}_{StudyDescription}".
+        "{PatientID}/{StudyDate}_{StudyDescription}", or its compiled version.
 
     Returns
     -------
     str
         The resolved string with all placeholders replaced by cleaned tag values.
     """
-    keys = {fname for _, fname, _, _ in string.Formatter().parse(structure) if fname is not None}
-    tags = {key: get_dicom_tag(dicom, key) for key in keys}
-    return structure.format(**tags)
+    return _as_compiled(structure)(dicom)
 
 
 def create_sort_folder(dicom: pydicom.Dataset, destination_folder: Path) -> Path:
     """Create the sort folder path for a DICOM file based on its standard hierarchy.
 
-    The folder name is fixed and not user-configurable:
-        {SeriesInstanceUID}_Irradiation Event UID
+    The folder name is fixed and not user-configurable (see SORT_FOLDER_STRUCTURE):
+        {SeriesInstanceUID}_{IrradiationEventUID}
 
     Parameters
     ----------
@@ -171,11 +585,21 @@ def create_sort_folder(dicom: pydicom.Dataset, destination_folder: Path) -> Path
     Path
         The folder where this DICOM file should be placed.
     """
-    return destination_folder / _resolve_structure(dicom, "{SeriesInstanceUID}_{IrradiationEventUID}")
+    return destination_folder / _sort_folder_name(dicom=dicom)
+
+
+def _sort_folder_name(dicom: pydicom.Dataset) -> str:
+    """Return the name of the sort folder of a DICOM file, see create_sort_folder."""
+    # Equivalent to _resolve_structure(dicom, SORT_FOLDER_STRUCTURE), without the generic resolver: this runs for
+    # every file.
+    series_instance_uid = dicom.get(_SERIES_INSTANCE_UID)
+    irradiation_event_uid = dicom.get(_IRRADIATION_EVENT_UID)
+    return (f"{clean_text('NA' if series_instance_uid is None else series_instance_uid.value)}"
+            f"_{clean_text('NA' if irradiation_event_uid is None else irradiation_event_uid.value)}")
 
 
 def create_file_name(dicom: pydicom.Dataset, used_names: set[str],
-                     name_structure: str = None) -> str:
+                     name_structure: str | CompiledStructure = None) -> str:
     """Create a unique file name for a DICOM instance within its destination folder.
 
     If the resolved name already exists in used_names, a numeric suffix (_1, _2, ...) is
@@ -188,10 +612,10 @@ def create_file_name(dicom: pydicom.Dataset, used_names: set[str],
     used_names : set[str]
         The set of file names already used in the destination folder. Updated in-place with
         the returned name.
-    name_structure : str, optional
+    name_structure : str | CompiledStructure, optional
         A format string using DICOM tag keywords, e.g. "{InstanceNumber}" or
-        "{Modality}_{InstanceNumber}". The .dcm extension is always added automatically.
-        Defaults to DEFAULT_FILE_NAME_STRUCTURE.
+        "{Modality}_{InstanceNumber}", or its compiled version (see compile_structure). The .dcm extension is always
+        added automatically. Defaults to DEFAULT_FILE_NAME_STRUCTURE.
 
     Returns
     -------
@@ -217,91 +641,376 @@ def create_file_name(dicom: pydicom.Dataset, used_names: set[str],
         counter += 1
 
 
-def save_dicom_file(dicom: pydicom.Dataset, file_path: Path, *, decompress: bool = True) -> None:
+def _ensure_folders(folders: Iterable[str | Path], created: set[str]) -> None:
+    """Create several folders (and their parents) at once, skipping the ones that were already created.
+
+    The folders are created in sorted order, which keeps the filesystem caches warm for shared parents. A folder that
+    is a parent of the next one in that order is created implicitly with it, so mostly only the leaves cost a mkdir
+    call.
+
+    Parameters
+    ----------
+    folders : Iterable[str | Path]
+        The folders to create.
+    created : set[str]
+        The folders created so far, e.g. during the current sort, so each folder costs a single mkdir call. The new
+        folders are added to it.
+    """
+    ordered: list[str] = sorted(set(map(os.fspath, folders)).difference(created))
+    for i, folder in enumerate(ordered):
+        # In sorted order, the descendants of a folder usually directly follow it.
+        if i + 1 < len(ordered) and ordered[i + 1].startswith(folder + os.sep):
+            continue
+        os.makedirs(folder, exist_ok=True)
+    created.update(ordered)
+
+
+def _existing_names(folder: str) -> set[str]:
+    """Return the names of the entries already in a folder, or an empty set if the folder does not exist (yet)."""
+    try:
+        return set(os.listdir(folder))
+    except OSError:
+        return set()
+
+
+def _copy_file(source_path: str | Path, file_path: str | Path) -> None:
+    """Copy a file while keeping the data in kernel space where the platform allows it.
+
+    On Windows, CopyFileW is used. Elsewhere, shutil.copyfile already copies in kernel space (sendfile on Linux,
+    fcopyfile on macOS), and falls back to a plain read and write if the filesystem does not support that.
+
+    Parameters
+    ----------
+    source_path : str | Path
+        The file to copy.
+    file_path : str | Path
+        The destination file. It is overwritten if it exists.
+    """
+    if sys.platform == "win32":
+        if ctypes.windll.kernel32.CopyFileW(str(source_path), str(file_path), False):
+            return
+
+    shutil.copyfile(source_path, file_path)
+
+
+def _move_file(source_path: str | Path, file_path: str | Path) -> None:
+    """Move a file instead of copying it.
+
+    Within one filesystem this is a rename, which only updates the directory entries, no matter how large the file is.
+    Across filesystems (or drives), shutil.move copies the file and deletes the source. An existing destination file
+    is never overwritten, as the source is gone afterward and the overwritten file would be lost.
+
+    Parameters
+    ----------
+    source_path : str | Path
+        The file to move.
+    file_path : str | Path
+        The destination file. It must not exist yet.
+
+    Raises
+    ------
+    FileExistsError
+        If the destination file already exists.
+    """
+    try:
+        if sys.platform == "win32":
+            # On Windows, a rename fails if the destination exists.
+            os.rename(source_path, file_path)
+        else:
+            # A rename would silently replace the destination. A hard link fails if it exists.
+            os.link(source_path, file_path)
+    except FileExistsError:
+        raise
+    except OSError:
+        # E.g. a different filesystem or drive, or a filesystem without hard links.
+        pass
+    else:
+        if sys.platform != "win32":
+            # The file is in place, only the source name is left to remove.
+            try:
+                os.remove(source_path)
+            except OSError as e:
+                print(f"Warning: Could not remove DICOM file {source_path}. Error: {e}")
+        return
+
+    if os.path.lexists(file_path):
+        raise FileExistsError(f"The destination file {file_path} already exists.")
+    shutil.move(source_path, file_path)
+
+
+def _is_compressed(dicom: pydicom.Dataset) -> bool:
+    """Return whether the transfer syntax of the dataset is compressed. A private transfer syntax counts as not
+    compressed, as pydicom cannot decompress it anyway."""
+    transfer_syntax = dicom.file_meta.get("TransferSyntaxUID")
+    return transfer_syntax is not None and transfer_syntax.is_transfer_syntax and transfer_syntax.is_compressed
+
+
+def save_dicom_file(dicom: pydicom.Dataset, file_path: str | Path, *, decompress: bool = True,
+                    source_path: Optional[str | Path] = None, copy_only: bool = True, move: bool = False) -> None:
     """Save the DICOM dataset to the specified file path.
 
     Parameters
     ----------
     dicom : pydicom.Dataset
         The DICOM dataset to save.
-    file_path : Path
+    file_path : str | Path
         The full path where the DICOM file should be saved.
     decompress : bool, optional
         Whether to attempt decompression if the DICOM dataset is compressed, by default True.
+    source_path : str | Path, optional
+        The file the dataset was read from. Required for copy_only.
+    copy_only : bool, optional
+        Whether to copy the original bytes from source_path when the dataset was not changed (i.e. not decompressed),
+        instead of re-encoding it with pydicom, by default True. Ignored if source_path is None.
+    move : bool, optional
+        Whether to move source_path instead of copying it, by default False. If the dataset had to be re-encoded, the
+        source file is deleted after saving. Ignored if source_path is None.
     """
     # Ensure the parent directory exists before saving the file. If it doesn't exist, it will be created.
-    file_path.parent.mkdir(parents=True, exist_ok=True)
+    parent_folder: str = os.path.dirname(file_path)
+    if parent_folder:  # Empty for a bare file name, i.e. the current folder.
+        os.makedirs(parent_folder, exist_ok=True)
 
     # Check if the DICOM dataset is compressed by examining the Transfer Syntax UID in the file meta-information. If it
     # is compressed, attempt to decompress it using the pydicom library's built-in decompression functionality. If
     # decompression fails for any reason, catch the exception and print a warning message.
-    if decompress and dicom.file_meta.TransferSyntaxUID.is_compressed:
+    decompressed: bool = False
+    if decompress and _is_compressed(dicom):
         try:
             dicom.decompress()
+            decompressed = True
         except Exception as e:
             print(f"Warning: Could not decompress DICOM file {file_path}. Error: {e}")
 
+    # The dataset is unchanged, so copy the original file instead of serializing every element again.
+    if copy_only and source_path is not None and not decompressed:
+        try:
+            if move:
+                _move_file(source_path=source_path, file_path=file_path)
+            else:
+                _copy_file(source_path=source_path, file_path=file_path)
+        except Exception as e:
+            print(f"Error: Could not save DICOM file {file_path}. Error: {e}")
+        return
+
     try:
         dicom.save_as(file_path, write_like_original=False)
     except Exception as e:
         print(f"Error: Could not save DICOM file {file_path}. Error: {e}")
+        return
+
+    # Only remove the source once its new version is safely written.
+    if move and source_path is not None:
+        try:
+            os.remove(source_path)
+        except OSError as e:
+            print(f"Warning: Could not remove DICOM file {source_path}. Error: {e}")
+
+
+def _prefetch_headers(executor: Executor, dicom_paths: Iterator[str],
+                      tags: Sequence[int]) -> Iterator[tuple[str, pydicom.Dataset]]:
+    """Read the headers of DICOM files ahead on an executor, while the caller works on the previous ones.
+
+    At most _HEADER_READ_AHEAD headers are in flight at a time. The headers are yielded in the order of dicom_paths.
+
+    Parameters
+    ----------
+    executor : Executor
+        The executor (typically a thread pool) that reads the headers.
+    dicom_paths : Iterator[str]
+        The DICOM files to read.
+    tags : Sequence[int]
+        The tags to read from each file.
+
+    Yields
+    ------
+    tuple[str, pydicom.Dataset]
+        Each path with its header.
+    """
+    pending: deque[tuple[str, Future]] = deque()
+    for dicom_path in dicom_paths:
+        pending.append((dicom_path, executor.submit(_read_header, dicom_path, tags)))
+        if len(pending) >= _HEADER_READ_AHEAD:
+            dicom_path, future = pending.popleft()
+            yield dicom_path, future.result()
+
+    while pending:
+        dicom_path, future = pending.popleft()
+        yield dicom_path, future.result()
+
+
+def _process_one(dicom_path: str, file_path: str, decompress: bool, move: bool = False) -> tuple[str, str]:
+    """Save a single DICOM file to its destination.
+
+    This runs on the save threads of sort_dicoms. Copying (os.copy_file_range, os.sendfile, CopyFileW) and the
+    decompression codecs (GDCM, pylibjpeg) run outside the GIL, so the threads really work in parallel.
+
+    Parameters
+    ----------
+    dicom_path : str
+        The DICOM file to save.
+    file_path : str
+        The full path where the DICOM file should be saved.
+    decompress : bool
+        Whether the file is compressed and should be decompressed. Otherwise, the file is copied as-is.
+    move : bool, optional
+        Whether to move the file instead of copying it, by default False.
+
+    Returns
+    -------
+    tuple[str, str]
+        The source path and the path the file was saved to.
+    """
+    if decompress:
+        # Decompression needs the full dataset, including the pixel data.
+        save_dicom_file(dicom=read_dicom_file(dicom_path=dicom_path), file_path=file_path, source_path=dicom_path,
+                        move=move)
+    else:
+        # Nothing to transform, only the bytes need to move. Same as the copy in save_dicom_file. The folder was
+        # already created by sort_dicoms.
+        try:
+            if move:
+                _move_file(source_path=dicom_path, file_path=file_path)
+            else:
+                _copy_file(source_path=dicom_path, file_path=file_path)
+        except Exception as e:
+            print(f"Error: Could not save DICOM file {file_path}. Error: {e}")
+    return dicom_path, file_path
 
 
-def sort_dicoms(source_path: Path, destination_path: Path,
-                file_name_structure: str | None = None) -> Generator[tuple[int, int], None, None]:
+def sort_dicoms(source_path: str | Path, destination_path: str | Path,
+                file_name_structure: str | CompiledStructure | None = None,
+                move: bool = False) -> Generator[tuple[int, int], None, None]:
     """Sort DICOM files from the source folder to the destination folder.
 
     The folder hierarchy is fixed (Patient → Study → Series) and always uses SeriesInstanceUID
     to guarantee that different reconstructions of the same acquisition are separated.
     Only the instance file name is user-configurable via file_name_structure.
 
+    The work is split in stages that overlap: the source folder is scanned in batches, the headers of the found files
+    are read ahead by a pool of threads, the destination of each file is resolved on the calling thread and the files are
+    saved by a second pool of threads. Within a batch, files are saved ordered by destination, so the writes to one
+    folder are not scattered. Files are saved while the source folder is still being scanned, so progress is reported
+    in completion order, not in discovery order.
+
     Parameters
     ----------
-    source_path : Path
+    source_path : str | Path
         The source folder containing DICOM files.
-    destination_path : Path
+    destination_path : str | Path
         The destination folder where sorted DICOM files will be saved.
-    file_name_structure : str, optional
+    file_name_structure : str | CompiledStructure, optional
         A format string for the instance file name, e.g. "{InstanceNumber}" or
-        "{Modality}_{InstanceNumber}". If the resolved name collides within a folder,
+        "{Modality}_{InstanceNumber}", or its compiled version. If the resolved name collides within a folder,
         a numeric suffix (_1, _2, ...) is added automatically. Defaults to
         DEFAULT_FILE_NAME_STRUCTURE.
+    move : bool, optional
+        Whether to move the files out of the source folder instead of copying them, by default False. On the same
+        filesystem, a move is a rename and no file data is read or written at all. Files already in the destination
+        are never overwritten when moving, the moved file gets a numeric suffix instead. A copy overwrites them.
 
     Yields
     ------
     Generator[tuple[int, int]]
-        Tuples of (current_index, total_files) for progress tracking. current_index is 1-based.
-    """
-    dicom_files: list[Path] = find_dicoms_in_folder(folder=source_path)
-
-    if not dicom_files:
-        yield 0, 0
-        return
+        Tuples of (bytes_done, bytes_total) for progress tracking, one per saved file. The byte counts are the sizes of
+        the source files, so they come for free with the scan. As long as the source folder is still being scanned,
+        bytes_total is the size of the files found so far, so it grows while the sort progresses.
 
-    # Track used file names per destination folder to detect and resolve naming collisions.
-    # 'used_names_per_fodler' is a mapping of each destination folder to the set of file names already placed in it.
-    used_names_per_folder: dict[Path, set[str]] = {}
+    Raises
+    ------
+    ValueError
+        If the destination folder is the source folder. The sorted files would end up in the folder being sorted.
+    """
+    if _resolved(source_path) == _resolved(destination_path):
+        raise ValueError("The destination folder must differ from the source folder.")
 
-    total: int = len(dicom_files)
-    for i, dicom_file in enumerate(dicom_files, start=1):
-        ds: pydicom.Dataset = read_dicom_file(dicom_path=dicom_file)
+    # Parse the file name structure once, instead of looking it up for every file.
+    name_structure: CompiledStructure = _as_compiled(file_name_structure or DEFAULT_FILE_NAME_STRUCTURE)
 
-        folder: Path = create_sort_folder(dicom=ds, destination_folder=destination_path)
+    # Only the tags needed to build the destination path are read, never the pixel data.
+    tags: tuple[int, ...] = _header_tags(SORT_FOLDER_STRUCTURE, name_structure.structure)
 
-        if folder not in used_names_per_folder:
-            used_names_per_folder[folder] = set()
+    # Paths are handled as strings from here on: joining strings is much cheaper than creating a Path for every file.
+    destination_folder: str = os.fspath(destination_path)
 
-        file_name: str = create_file_name(dicom=ds, used_names=used_names_per_folder[folder],
-                                          name_structure=file_name_structure)
-        save_dicom_file(dicom=ds, file_path=folder / file_name)
-        yield i, total
+    # Track used file names per destination folder to detect and resolve naming collisions.
+    # 'used_names_per_folder' is a mapping of each destination folder to the set of file names already placed in it.
+    used_names_per_folder: dict[str, set[str]] = {}
+
+    # The folders created during this sort. Only kept for this sort, as restructure_sorted_folders moves them.
+    created_folders: set[str] = set()
+
+    # Finished futures are collected through this queue, so the scan never has to poll the pending futures.
+    completed: queue.SimpleQueue[Future] = queue.SimpleQueue()
+    # The size of the source file of every pending future.
+    pending_sizes: dict[Future, int] = {}
+
+    total: int = 0
+    done: int = 0
+    bytes_total: int = 0
+    bytes_done: int = 0
+    # Saving is mostly copying and decompressing, both of which release the GIL. A thread pool avoids starting
+    # processes (slow on Windows, and fragile in the frozen executable) and never has to pickle anything.
+    with (ThreadPoolExecutor(max_workers=_HEADER_READ_THREADS) as readers,
+          ThreadPoolExecutor(max_workers=os.cpu_count()) as writers):
+        # The destination may be inside the source folder. It is written to during the scan, so it is left out. It is
+        # created first, so the scan can recognize it.
+        os.makedirs(destination_folder, exist_ok=True)
+        for batch in find_dicom_batches(folder=source_path, exclude=destination_folder):
+            # First pass: resolve the destination of every file in the batch from its header.
+            plans: list[tuple[str, str, bool, int]] = []
+            folders: set[str] = set()
+            headers = _prefetch_headers(executor=readers, dicom_paths=batch.path_strings(), tags=tags)
+            for (dicom_file, ds), size in zip(headers, batch.sizes):
+                folder: str = os.path.join(destination_folder, _sort_folder_name(dicom=ds))
+                if folder not in used_names_per_folder:
+                    # When moving, files already in the folder (e.g. from an earlier sort) must not be overwritten, as
+                    # they could be lost for good. Their names count as used. A copy overwrites them, as before.
+                    used_names_per_folder[folder] = _existing_names(folder) if move else set()
+                folders.add(folder)
+
+                file_name: str = create_file_name(dicom=ds, used_names=used_names_per_folder[folder],
+                                                  name_structure=name_structure)
+                plans.append((os.path.join(folder, file_name), dicom_file, _is_compressed(ds), size))
+
+            # Create all destination folders of the batch at once, before any file is saved into them.
+            _ensure_folders(folders, created=created_folders)
+
+            # Second pass: save the files ordered by destination, so each destination folder is written in one go.
+            plans.sort(key=lambda plan: plan[0])
+            for file_path, dicom_file, compressed, size in plans:
+                future: Future = writers.submit(_process_one, dicom_file, file_path, compressed, move)
+                pending_sizes[future] = size
+                future.add_done_callback(completed.put)
+                total += 1
+                bytes_total += size
+
+                # Report the files finished so far. Block only if too many files are pending.
+                while total - done >= _MAX_PENDING_FILES or not completed.empty():
+                    finished: Future = completed.get()
+                    finished.result()  # Re-raise any exception from the worker.
+                    done += 1
+                    bytes_done += pending_sizes.pop(finished)
+                    yield bytes_done, bytes_total
+
+        # The scan is finished, from here on the total is final.
+        while done < total:
+            finished = completed.get()
+            finished.result()
+            done += 1
+            bytes_done += pending_sizes.pop(finished)
+            yield bytes_done, bytes_total
+
+    if total == 0:
+        yield 0, 0
 
 
-def restructure_sorted_folders(root: Path, folder_structure: str,
-                               file_name_structure: str | None = None) -> Generator[tuple[int, int], None, None]:
+def restructure_sorted_folders(root: Path, folder_structure: str | CompiledStructure,
+                               file_name_structure: str | CompiledStructure | None = None
+                               ) -> Generator[tuple[int, int], None, None]:
     """Rename the series subfolders (and optionally their files) inside a sorted destination.
 
-    Reads one DICOM file per series subfolder to extract the metadata for the folder rename.
+    Reads the header of one DICOM file per series subfolder to extract the metadata for the folder rename.
     If file_name_structure is provided, every file in each subfolder is also renamed before
     the folder is moved. File naming collisions within a folder are resolved automatically by
     appending _1, _2, etc.
@@ -311,25 +1020,34 @@ def restructure_sorted_folders(root: Path, folder_structure: str,
     root : Path
         The root destination folder produced by sort_dicoms, containing one flat subfolder
         per series.
-    folder_structure : str
+    folder_structure : str | CompiledStructure
         A format string using DICOM tag keywords that defines the new folder hierarchy relative
-        to root, e.g. "{PatientID}/{StudyDate}_{StudyDescription}/{SeriesNumber}_{SeriesDescription}".
-    file_name_structure : str, optional
+        to root, e.g. "{PatientID}/{StudyDate}_{StudyDescription}/{SeriesNumber}_{SeriesDescription}", or its compiled
+        version (see compile_structure).
+    file_name_structure : str | CompiledStructure, optional
         A format string for the instance file name, e.g. "{InstanceNumber}" or
-        "{Modality}_{InstanceNumber}". If None, existing file names are kept as-is.
+        "{Modality}_{InstanceNumber}", or its compiled version. If None, existing file names are kept as-is.
 
     Yields
     ------
     Generator[tuple[int, int]]
-        Tuples of (current_index, total_folders) for progress tracking. current_index is 1-based.
+        Tuples of (folders_done, folders_total) for progress tracking, one per series subfolder, like sort_dicoms.
     """
+    # Parse the structures once, instead of looking them up for every file.
+    folder_structure = _as_compiled(folder_structure)
+    if file_name_structure is not None:
+        file_name_structure = _as_compiled(file_name_structure)
+
+    # Only the tags used in the structures are read from the files.
+    folder_tags: tuple[int, ...] = folder_structure.tags
+    file_tags: tuple[int, ...] = file_name_structure.tags if file_name_structure is not None else ()
+
     series_folders: list[Path] = [p for p in root.iterdir() if p.is_dir()]
 
-    if not series_folders:
+    total: int = len(series_folders)
+    if total == 0:
         yield 0, 0
-        return
 
-    total: int = len(series_folders)
     for i, series_folder in enumerate(series_folders, start=1):
         dicom_files: list[Path] = [p for p in series_folder.rglob('*') if p.is_file()]
         if not dicom_files:
@@ -337,12 +1055,12 @@ def restructure_sorted_folders(root: Path, folder_structure: str,
             continue
 
         # Read one file for the folder-level tags (all files in the folder share the same series).
-        ds: pydicom.Dataset = read_dicom_file(dicom_path=dicom_files[0])
+        ds: pydicom.Dataset = _read_header(dicom_path=dicom_files[0], tags=folder_tags)
 
         if file_name_structure is not None:
             used_names: set[str] = set()
             for dicom_file in dicom_files:
-                file_ds: pydicom.Dataset = read_dicom_file(dicom_path=dicom_file)
+                file_ds: pydicom.Dataset = _read_header(dicom_path=dicom_file, tags=file_tags)
                 new_name: str = create_file_name(dicom=file_ds, used_names=used_names,
                                                  name_structure=file_name_structure)
                 dicom_file.rename(dicom_file.parent / new_name)
@@ -359,5 +1077,6 @@ if __name__ == "__main__":
     # for current, total in sort_dicoms(source, destination):
     #     print(f"{current}/{total}")
 
-    for current, total in restructure_sorted_folders(destination, "{PatientID}/{StudyDate}/{KVP}/{SliceThickness}/{ConvolutionKernel}","{Modality}_{InstanceNumber}_{KVP}_{SliceThickness}_{ConvolutionKernel}.dcm"):
+    progress = restructure_sorted_folders(destination, "{PatientID}/{StudyDate}/{KVP}/{SliceThickness}/{ConvolutionKernel}","{Modality}_{InstanceNumber}_{KVP}_{SliceThickness}_{ConvolutionKernel}.dcm")
+    for current, total in progress:
         print(f"{current}/{total}")
@@ -33,6 +33,32 @@ def open_website(url: str) -> None:
     webbrowser.open(url)
 
 
+def _get_asset_base() -> Path:
+    """Get the absolute path to the folder containing the 'assets' folder.
+
+    Returns
+    -------
+    Path
+        The absolute path to the base folder of the assets.
+    """
+    # Check if the application is run from a frozen state (e.g., an executable created with PyInstaller).
+    # PyInstaller sets sys.frozen to True and uses sys._MEIPASS to store the temporary directory.
+    if getattr(sys, "frozen", False):  # Returns False if the attribute 'frozen' does not exist.
+        # We are running in a frozen state, i.e., from the executable. We need to use the temporary directory
+        # created by PyInstaller: sys._MEIPASS.
+        return Path(getattr(sys, "_MEIPASS"))  # Since there is no default value, we can use getattr safely.
+
+    # We are not running in a frozen state, i.e., from the source code. Use the current directory.
+    # __file__ is the path to the current file.
+    # resolve() gives the absolute path.
+    # parent.parent goes two levels up to the root of the project (one level would be the utils directory).
+    return Path(__file__).resolve().parent.parent
+
+
+# The base folder does not change while the application runs, so it is resolved once, at import.
+_ASSET_BASE: Path = _get_asset_base()
+
+
 def get_asset(relative_path: str) -> Path:
     """Get the absolute path to an asset file.
 
@@ -46,20 +72,7 @@ def get_asset(relative_path: str) -> Path:
     str
         The absolute path to the asset file.
     """
-    # Check if the application is run from a frozen state (e.g., an executable created with PyInstaller).
-    # PyInstaller sets sys.frozen to True and uses sys._MEIPASS to store the temporary directory.
-    if getattr(sys, "frozen", False):  # Returns False if the attribute 'frozen' does not exist.
-        # We are running in a frozen state, i.e., from the executable. We need to use the temporary directory
-        # created by PyInstaller: sys._MEIPASS.
-        base: Path = Path(getattr(sys, "_MEIPASS"))  # Since there is no default value, we can use getattr safely.
-    else:
-        # We are not running in a frozen state, i.e., from the source code. Use the current directory.
-        # __file__ is the path to the current file.
-        # resolve() gives the absolute path.
-        # parent.parent goes two levels up to the root of the project (one level would be the utils directory).
-        base = Path(__file__).resolve().parent.parent
-
-    return base / relative_path
+    return _ASSET_BASE / relative_path
 
 
 if __name__ == "__main__":
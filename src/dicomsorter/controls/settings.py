@@ -1,6 +1,9 @@
+import copy
+import os
+from pathlib import Path
 from typing import Any
 
-from toml import load, dump
+from toml import load, dumps
 
 from dicomsorter.controls.explorer import get_asset
 
@@ -9,16 +12,42 @@ from dicomsorter.controls.explorer import get_asset
 #  Because the _MEIPASS directory is actually read-only and resets every time the application is restarted, we
 #  need to save the settings to a different location.
 
+# The settings as last read from or written to the file. Used to skip writes that would not change anything.
+_last_saved: dict[str, Any] | None = None
+
 
 def read_settings() -> dict[str, Any]:
     """Read settings from a TOML file."""
+    global _last_saved
     try:
-        return load(get_asset("assets/settings.toml"))
+        settings: dict[str, Any] = load(get_asset("assets/settings.toml"))
     except FileNotFoundError:
         return {}
 
+    _last_saved = copy.deepcopy(settings)
+    return settings
+
 
 def save_settings(settings: dict[str, Any]) -> None:
-    """Save settings to a TOML file."""
-    with open(get_asset("assets/settings.toml"), "w") as f:
-        dump(settings, f)
+    """Save settings to a TOML file.
+
+    Nothing is written if the settings did not change since they were last read or saved. The file is written to a
+    temporary file first and then moved in place, so an interrupted save never leaves a corrupt settings file.
+    """
+    global _last_saved
+    if settings == _last_saved:
+        return
+
+    # Serialized before anything is opened, so a settings value that cannot be written leaves no file behind.
+    text: str = dumps(settings)
+
+    path: Path = get_asset("assets/settings.toml")
+    temporary_path: Path = path.with_suffix(".toml.tmp")
+    with open(temporary_path, "w") as f:
+        f.write(text)  # A single write of the whole file.
+        # Make sure the data is on disk before the rename, otherwise a crash could leave an empty settings file.
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary_path, path)
+
+    _last_saved = copy.deepcopy(settings)
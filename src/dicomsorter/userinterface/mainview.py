@@ -1,18 +1,37 @@
+import asyncio
+import functools
+import queue
+import threading
 import tkinter as tk
 from pathlib import Path
 from tkinter import ttk
 from tkinter import messagebox, filedialog
+from typing import TYPE_CHECKING
 
-from dicomsorter.controls.dicom import sort_dicoms, restructure_sorted_folders
 from dicomsorter.controls.explorer import open_folder, open_website, get_asset
 from dicomsorter.userinterface.settingsview import SettingsView
 from dicomsorter.controls.settings import read_settings
 
+if TYPE_CHECKING:
+    # Only for the type hints. The module itself (and pydicom with it) is imported once sorting starts, see
+    # _start_sorting_button_pressed.
+    from dicomsorter.controls.dicom import CompiledStructure
+
+# How long (in seconds) between two redraws of the progress bar while sorting, i.e. about 20 redraws per second.
+PROGRESS_INTERVAL: float = 0.05
+# How long (in seconds) the event loop waits between two rounds of Tk event processing.
+UPDATE_INTERVAL: float = 0.01
+
 
 class MainView:
 
+    # The structures used when the settings do not specify any.
+    DEFAULT_FILE_STRUCTURE: str = "{Modality}_{InstanceNumber}_{KVP}_{SliceThickness}_{ConvolutionKernel}.dcm"
+    DEFAULT_FOLDER_STRUCTURE: str = "{PatientID}/{StudyDate}/{KVP}/{SliceThickness}/{ConvolutionKernel}"
+
     def __init__(self) -> None:
         self._root: tk.Tk = tk.Tk()
+        self._root.withdraw()  # Hidden until its title, size and position are set.
 
         self._size: tuple[int, int] = (750, 500)
         self._position: tuple[int, int] = (0, 0)
@@ -21,27 +40,44 @@ class MainView:
         self._author: str = "Seppe Van Bogaert"
         self._year: str = "2025"
 
-        self._build_ui()
-
-    def _build_ui(self) -> None:
-        """Build the user interface."""
-        # Read settings.
-        settings = read_settings()
-
-        # Initialize the main window.
+        # Whether the event loop in _main_async should keep running.
+        self._running: bool = False
+        # The running sort, if any. A reference is kept, as the event loop only keeps a weak reference to its tasks.
+        self._sorting_task: asyncio.Task | None = None
+        # The open settings window, if any, waiting to apply the settings once it is closed.
+        self._settings_task: asyncio.Task | None = None
+        # The folder last chosen with a 'Browse...' button, the next folder dialog starts there.
+        self._last_browse_dir: str | None = None
+        # The source folder the destination folder was last filled in for, and the pending (debounced) fill, if any.
+        self._last_copied_source: str | None = None
+        self._fill_destination_job: str | None = None
+
+        # Show the (empty) window right away, and fill it as soon as the event loop runs.
+        self._build_window()
+        self._root.deiconify()
+        self._root.after_idle(func=self._build_ui)
+
+    def _build_window(self) -> None:
+        """Initialize the main window."""
         self._root.title(string=self._title)
         self._root.geometry(newGeometry=f"{self._size[0]}x{self._size[1]}"
                                         f"+{max(0, (self._root.winfo_screenwidth() - self._size[0]) // 2 + self._position[0])}"
                                         f"+{max(0, (self._root.winfo_screenheight() - self._size[1]) // 2 + self._position[1])}")
         self._root.minsize(width=750, height=460)
         self._root.iconbitmap(get_asset("assets/dora.ico"))
+        self._root.protocol(name="WM_DELETE_WINDOW", func=self._quit)
+
+    def _build_ui(self) -> None:
+        """Build the user interface."""
+        # Read settings.
+        settings = read_settings()
 
         # Creating the menubar.
         menubar: tk.Menu = tk.Menu(master=self._root)
 
         # Adding the File menu.
         file_menu: tk.Menu = tk.Menu(master=menubar, tearoff=False)
-        file_menu.add_command(label="Exit", command=self._root.quit)
+        file_menu.add_command(label="Exit", command=self._quit)
         menubar.add_cascade(label="File", menu=file_menu)
 
         # Adding the Settings menu.
@@ -67,17 +103,19 @@ class MainView:
         ttk.Label(master=paths_frame, text="Source Folder:").grid(row=0, column=0, padx=(0, 10), sticky="e")
         ttk.Label(master=paths_frame, text="Destination Folder:").grid(row=1, column=0, padx=(0, 10), sticky="e")
 
-        self._source_entry: ttk.Entry = ttk.Entry(master=paths_frame)
+        self._source_var = tk.StringVar()
+        self._destination_var = tk.StringVar()
+        self._source_entry: ttk.Entry = ttk.Entry(master=paths_frame, textvariable=self._source_var)
         self._source_entry.grid(row=0, column=1, sticky="ew", rowspan=True, padx=(0, 10))
-        self._source_entry.bind(sequence="<FocusOut>", func=lambda event: self._fill_destination_field_based_on_source_field())
-        self._destination_entry: ttk.Entry = ttk.Entry(master=paths_frame)
+        self._source_entry.bind(sequence="<FocusOut>", func=lambda event: self._schedule_fill_destination_field())
+        self._destination_entry: ttk.Entry = ttk.Entry(master=paths_frame, textvariable=self._destination_var)
         self._destination_entry.grid(row=1, column=1, sticky="ew", rowspan=True, padx=(0, 10))
 
         ttk.Button(master=paths_frame, text="Browse...",
-                   command=lambda: self._browse_button_pressed(kind="source")
+                   command=self._browse_source
                    ).grid(row=0, column=2, padx=(0, 10), sticky="w")
         ttk.Button(master=paths_frame, text="Browse...",
-                   command=lambda: self._browse_button_pressed(kind="destination")
+                   command=self._browse_destination
                    ).grid(row=1, column=2, padx=(0, 10), sticky="w")
 
         # Add a horizontal separator.
@@ -92,10 +130,10 @@ class MainView:
         ttk.Label(master=structure_frame, text="Folder name structure:").grid(row=2, column=0, padx=(0, 10), sticky="e")
 
         self._default_file_structure = tk.StringVar(
-            value=settings.get("default_file_structure", "{Modality}_{InstanceNumber}_{KVP}_{SliceThickness}_{ConvolutionKernel}.dcm")
+            value=settings.get("default_file_structure", self.DEFAULT_FILE_STRUCTURE)
         )
         self._default_folder_structure = tk.StringVar(
-            value=settings.get("default_folder_structure", "{PatientID}/{StudyDate}/{KVP}/{SliceThickness}/{ConvolutionKernel}")
+            value=settings.get("default_folder_structure", self.DEFAULT_FOLDER_STRUCTURE)
         )
         self._file_structure_entry: ttk.Entry = ttk.Entry(master=structure_frame,
                                                           textvariable=self._default_file_structure)
@@ -105,10 +143,10 @@ class MainView:
         self._folder_structure_entry.grid(row=2, column=1, sticky="ew", rowspan=True, padx=(0, 10))
 
         ttk.Button(master=structure_frame, text="Default",
-                   command=lambda: self._default_button_pressed(kind="file")
+                   command=self._default_file
                    ).grid(row=0, column=2, padx=(0, 10), sticky="w")
         ttk.Button(master=structure_frame, text="Default",
-                   command=lambda: self._default_button_pressed(kind="folder")
+                   command=self._default_folder
                    ).grid(row=2, column=2, padx=(0, 10), sticky="w")
 
         # Add buttons below each entry for adding DICOM tags.
@@ -122,10 +160,10 @@ class MainView:
                                   "ConvolutionKernel"]
         for tag in common_tags:
             ttk.Button(master=self._tag_button_file_frame, text=tag,
-                       command=lambda t=tag: self._add_dicom_tag_button_pressed(tag=t, kind="file")
+                       command=functools.partial(self._add_dicom_tag_button_pressed, tag=tag, kind="file")
                        ).pack(side="left", padx=5, pady=2)
             ttk.Button(master=self._tag_button_folder_frame, text=tag,
-                       command=lambda t=tag: self._add_dicom_tag_button_pressed(tag=t, kind="folder")
+                       command=functools.partial(self._add_dicom_tag_button_pressed, tag=tag, kind="folder")
                        ).pack(side="left", padx=5, pady=2)
 
         if not settings.get("enable_common_tags_buttons", True):
@@ -139,10 +177,31 @@ class MainView:
         ttk.Button(self._root, text="Start Sorting", command=self._start_sorting_button_pressed).pack(pady=20)
         self._root.bind(sequence="<Return>", func=lambda event: self._start_sorting_button_pressed())
 
+        # Lay out all widgets in one go.
+        self._root.update_idletasks()
+
     def _open_settings(self) -> None:
-        """Open the settings window."""
+        """Open the settings window. The settings are applied once it is closed, see _edit_settings."""
+        self._settings_task = asyncio.get_running_loop().create_task(self._edit_settings())
+
+    async def _edit_settings(self) -> None:
+        """Show the settings window and apply the settings once it is closed.
+
+        Waiting does not block the event loop, unlike wait_window, which would run a nested Tk event loop.
+        """
         self._settings_view = SettingsView(master=self._root)
-        self._root.wait_window(self._settings_view.window)
+        window: tk.Toplevel = self._settings_view.window
+
+        # Completed when the settings window is destroyed, i.e. closed and its settings saved.
+        closed: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        def on_destroy(event: tk.Event) -> None:
+            # The binding also fires for every widget inside the window, only the window itself counts.
+            if event.widget is window and not closed.done():
+                closed.set_result(None)
+
+        window.bind(sequence="<Destroy>", func=on_destroy, add="+")
+        await closed
 
         # Rebuild the UI to reflect any changes in settings.
         settings = read_settings()
@@ -157,8 +216,8 @@ class MainView:
 
         # Update the entry fields with the default values from settings.
         # REMARK: Is this necessary? The user could just press the 'Default' button.
-        self._default_file_structure.set(settings.get("default_file_structure", "{Modality}_{InstanceNumber}_{KVP}_{SliceThickness}_{ConvolutionKernel}.dcm"))
-        self._default_folder_structure.set(settings.get("default_folder_structure", "{PatientID}/{StudyDate}/{KVP}/{SliceThickness}/{ConvolutionKernel}"))
+        self._default_file_structure.set(settings.get("default_file_structure", self.DEFAULT_FILE_STRUCTURE))
+        self._default_folder_structure.set(settings.get("default_folder_structure", self.DEFAULT_FOLDER_STRUCTURE))
 
     def _add_dicom_tag_button_pressed(self, tag: str, kind: str) -> None:
         """Add a DICOM tag to the appropriate entry field.
@@ -174,97 +233,191 @@ class MainView:
             raise ValueError("Invalid kind. Must be 'file' or 'folder'.")
 
         # Add the tag to the appropriate entry field.
-        entry: tk.Entry = self._file_structure_entry if kind == "file" else self._folder_structure_entry
-        current_text: str = entry.get()
+        variable: tk.StringVar = self._default_file_structure if kind == "file" else self._default_folder_structure
+        current_text: str = variable.get()
         if current_text and not current_text.endswith(("/", "_")):
             # Add a separator if needed.
             separator: str = "_" if kind == "file" else "/"
             current_text += separator
-        entry.delete(first=0, last=tk.END)
-        entry.insert(index=0, string=current_text + "{" + tag + "}")
+        variable.set(current_text + "{" + tag + "}")
+
+    def _schedule_fill_destination_field(self) -> None:
+        """Fill in the destination folder after a short delay.
+
+        A burst of focus changes (e.g. from a closing dialog) then only fills it in once.
+        """
+        if self._fill_destination_job is not None:
+            self._root.after_cancel(id=self._fill_destination_job)
+        self._fill_destination_job = self._root.after(ms=150, func=self._fill_destination_field_based_on_source_field)
 
     def _fill_destination_field_based_on_source_field(self) -> None:
         """Copy the source folder path to the destination folder path, with minor changes."""
-        entry_dest: str = self._source_entry.get()
+        self._fill_destination_job = None
+        entry_dest: str = self._source_var.get()
 
         if not entry_dest:
             return  # Do nothing if the source entry is empty.
+        if entry_dest == self._last_copied_source:
+            return  # Already filled in for this source folder.
+        self._last_copied_source = entry_dest
 
-        parent_folder: Path = Path(entry_dest).parent
-        self._destination_entry.delete(first=0, last=tk.END)
-        self._destination_entry.insert(index=0,
-                                       string=str(parent_folder / "sorted_dicoms").replace("\\", "/"))
+        # Next to the source folder, with forward slashes. Path.parent keeps a root (e.g. C:/ or /) as it is.
+        self._destination_var.set((Path(entry_dest).parent / "sorted_dicoms").as_posix())
 
-    def _default_button_pressed(self, kind: str) -> None:
-        """Set the default structure in the appropriate entry field.
-
-        Parameters
-        ----------
-        kind : str
-            The kind of structure to set ('file' or 'folder').
-        """
-        if kind not in ("file", "folder"):
-            raise ValueError("Invalid kind. Must be 'file' or 'folder'.")
-
-        # Read settings.
-        settings = read_settings()
+    def _default_file(self) -> None:
+        """Set the default file name structure in its entry field."""
+        default: str = read_settings().get("default_file_structure", self.DEFAULT_FILE_STRUCTURE)
+        self._default_file_structure.set(default)
 
-        # Put the default in the appropriate entry field.
-        entry: tk.Entry = self._file_structure_entry if kind == "file" else self._folder_structure_entry
-        entry.delete(first=0, last=tk.END)
-        entry.insert(index=0,
-                     string={"file": settings.get("default_file_structure", "{Modality}_{InstanceNumber}_{KVP}_{SliceThickness}_{ConvolutionKernel}.dcm"),
-                             "folder": settings.get("default_folder_structure", "{PatientID}/{StudyDate}/{KVP}/{SliceThickness}/{ConvolutionKernel}")}[kind]
-                     )
+    def _default_folder(self) -> None:
+        """Set the default folder structure in its entry field."""
+        default: str = read_settings().get("default_folder_structure", self.DEFAULT_FOLDER_STRUCTURE)
+        self._default_folder_structure.set(default)
 
     def _start_sorting_button_pressed(self) -> None:
         """Handle the event when the start sorting button is pressed."""
-        source_folder: str = self._source_entry.get()
-        destination_folder: str = self._destination_entry.get()
+        # Only one sort at a time, another click or Enter press while sorting is ignored.
+        if self._sorting_task is not None and not self._sorting_task.done():
+            return
+
+        source_folder: str = self._source_var.get()
+        destination_folder: str = self._destination_var.get()
 
         if not source_folder or not destination_folder:
             messagebox.showwarning(title="Input Required",
                                    message="Please specify both a source and a destination folder.")
             return
 
-        self._destination_path = Path(destination_folder)
-        self._folder_structure = self._folder_structure_entry.get()
-        self._file_name_structure = self._file_structure_entry.get()
+        # Imported only now, as loading pydicom takes a noticeable part of the start-up time of the application.
+        from dicomsorter.controls.dicom import compile_structure
+
+        # Parse the structures once here, instead of for every file. This also catches typos before sorting starts.
+        file_name_structure: str = self._default_file_structure.get()
+        try:
+            self._folder_structure: "CompiledStructure" = compile_structure(self._default_folder_structure.get())
+            self._file_name_structure: "CompiledStructure | None" = (compile_structure(file_name_structure)
+                                                                     if file_name_structure else None)
+        except ValueError as e:
+            messagebox.showwarning(title="Invalid Structure",
+                                   message=f"The file or folder name structure is not valid: {e}")
+            return
 
-        # Create a progress bar.
-        self._progress_bar = ttk.Progressbar(master=self._root, mode="determinate")
+        self._destination_folder: str = destination_folder
+
+        # Create a progress bar. It keeps moving until the first progress is reported.
+        self._progress_bar = ttk.Progressbar(master=self._root, mode="indeterminate")
         self._progress_bar.pack(fill="x", padx=10, pady=10)
-        self._progress_bar["value"] = 0
+        self._progress_bar.start(interval=int(PROGRESS_INTERVAL * 1000))
+
+        # The sort runs as a task on the event loop of _main_async, next to the Tk event processing.
+        self._sorting_task = asyncio.get_running_loop().create_task(self._sort(source_folder=source_folder))
 
-        # Phase 1: sort into flat series folders (folder structure applied in phase 2).
-        self._progress_iteration = sort_dicoms(source_path=Path(source_folder),
-                                               destination_path=self._destination_path)
-        self._update_progress_bar(phase="sort")
+    async def _sort(self, source_folder: str) -> None:
+        """Sort the DICOM files and restructure the result, while showing the progress.
+
+        The sorting itself runs on a worker thread (see _run_sort), so reading and writing files never waits for the
+        user interface. Here, only its progress is picked up and shown, every PROGRESS_INTERVAL seconds.
+
+        Parameters
+        ----------
+        source_folder : str
+            The folder containing the DICOM files to sort.
+        """
+        progress: queue.Queue = queue.Queue()
+        threading.Thread(target=self._run_sort,
+                         args=(source_folder, self._destination_folder, self._folder_structure,
+                               self._file_name_structure, progress),
+                         daemon=True).start()
+
+        phase: str | None = None
+        maximum: int = 0
+        finished: bool = False
+        while not finished:
+            await asyncio.sleep(PROGRESS_INTERVAL)
+
+            # Take all progress reported since the last round, only the latest is drawn.
+            latest: tuple[str, int, int] | None = None
+            while not finished:
+                try:
+                    message = progress.get_nowait()
+                except queue.Empty:
+                    break
+
+                if message is None:
+                    finished = True
+                elif isinstance(message, Exception):
+                    # Sorting failed. Nothing awaits this task, so an exception raised here would go unnoticed.
+                    self._progress_bar.stop()
+                    self._progress_bar.destroy()
+                    messagebox.showerror(title="Sorting Failed",
+                                         message=f"The DICOM files could not be sorted: {message}")
+                    return
+                else:
+                    latest = message
+
+            if latest is None:
+                continue
+            latest_phase, iteration, total = latest
+            if latest_phase != phase:
+                # The first progress of a phase, start the progress bar over.
+                phase = latest_phase
+                self._progress_bar.stop()
+                self._progress_bar["mode"] = "determinate"
+                maximum = 0
+            if total != maximum:
+                # Only set when the total changes. While the source folder is being scanned, it grows.
+                maximum = total
+                self._progress_bar["maximum"] = max(total, 1)
+            self._progress_bar["value"] = iteration
+
+        self._progress_bar.destroy()
+        await self._show_done_message()
+
+    @staticmethod
+    def _run_sort(source_folder: str, destination_folder: str, folder_structure: "CompiledStructure",
+                  file_name_structure: "CompiledStructure | None", progress: queue.Queue) -> None:
+        """Sort the DICOM files and restructure the result. This runs on a worker thread, so it must not touch Tk.
+
+        Parameters
+        ----------
+        source_folder : str
+            The folder containing the DICOM files to sort.
+        destination_folder : str
+            The folder to sort the DICOM files into.
+        folder_structure : CompiledStructure
+            The folder structure to restructure the sorted folders into.
+        file_name_structure : CompiledStructure | None
+            The file name structure to rename the sorted files to, or None for the default.
+        progress : queue.Queue
+            Receives tuples of (phase, iteration, total), with phase 'sort' or 'restructure'. When done, None is put,
+            or the exception if sorting failed.
+        """
+        # Already imported by _start_sorting_button_pressed.
+        from dicomsorter.controls.dicom import restructure_sorted_folders, sort_dicoms
 
-    def _update_progress_bar(self, phase: str) -> None:
-        """Update the progress bar based on the current iteration of the sorting process."""
         try:
-            iteration, total = next(self._progress_iteration)
-            if total > 0:
-                self._progress_bar["maximum"] = total
-                self._progress_bar["value"] = iteration  # 'iteration' is a one-based index.
-            self._root.after_idle(func=lambda: self._update_progress_bar(phase))  # type: ignore
-        except StopIteration:
-            if phase == "sort":
-                # Phase 2: rename folders and files to the user-specified structure.
-                self._progress_bar["value"] = 0
-                self._progress_iteration = restructure_sorted_folders(
-                    root=self._destination_path,
-                    folder_structure=self._folder_structure,
-                    file_name_structure=self._file_name_structure or None
-                )
-                self._root.after_idle(func=lambda: self._update_progress_bar(phase="restructure"))  # type: ignore
-            else:
-                self._progress_bar.destroy()
-                self._show_done_message()
-
-    def _show_done_message(self) -> None:
-        """Show a dialog indicating that the sorting is done, with an option to open the destination folder."""
+            # Phase 1: sort into flat series folders (folder structure applied in phase 2). The sort reports its
+            # progress in bytes, as files can differ a lot in size. The paths are passed as strings, the sort works on
+            # strings internally.
+            for bytes_done, bytes_total in sort_dicoms(source_path=source_folder, destination_path=destination_folder):
+                progress.put(("sort", bytes_done, bytes_total))
+
+            # Phase 2: rename folders and files to the user-specified structure.
+            for folders_done, folders_total in restructure_sorted_folders(root=Path(destination_folder),
+                                                                          folder_structure=folder_structure,
+                                                                          file_name_structure=file_name_structure):
+                progress.put(("restructure", folders_done, folders_total))
+        except Exception as e:
+            progress.put(e)
+        else:
+            progress.put(None)
+
+    async def _show_done_message(self) -> None:
+        """Show a dialog indicating that the sorting is done, with an option to open the destination folder.
+
+        Returns once the dialog is closed. Waiting does not block the event loop, unlike wait_window, which would run a
+        nested Tk event loop.
+        """
         window = tk.Toplevel(master=self._root)
         window.title("Sorting Complete")
         window.geometry(
@@ -278,39 +431,62 @@ class MainView:
         button_frame.pack(pady=(0, 10))
 
         ttk.Button(master=button_frame, text="Open Folder",
-                   command=lambda: open_folder(Path(self._destination_entry.get()))
+                   command=lambda: open_folder(Path(self._destination_var.get()))
                    ).pack(side="left", padx=5)
-        ttk.Button(master=button_frame, text="Ok", command=window.destroy).pack(side="left", padx=5)
+        # Completed when the dialog is closed, with the 'Ok' button or the window manager.
+        closed: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        def close() -> None:
+            if not closed.done():
+                closed.set_result(None)
+
+        ttk.Button(master=button_frame, text="Ok", command=close).pack(side="left", padx=5)
+        window.protocol(name="WM_DELETE_WINDOW", func=close)
 
         window.transient(master=self._root)  # Set to be on top of the main window.
         window.grab_set()  # Make the dialog modal, i.e., block interaction with other windows.
-        self._root.wait_window(window)  # Wait until the window is closed.
+        try:
+            await closed  # Wait until the window is closed.
+        finally:
+            window.destroy()
 
-    def _browse_button_pressed(self, kind: str) -> None:
-        """Handle the event when the browse button is pressed.
+    def _ask_folder(self, title: str) -> str | None:
+        """Let the user choose a folder.
 
         Parameters
         ----------
-        kind : str
-            The kind of folder to browse for ('source' or 'destination').
-        """
-        if kind not in ("source", "destination"):
-            raise ValueError("Invalid kind. Must be 'source' or 'destination'.")
+        title : str
+            The title of the folder dialog.
 
-        # let the user choose a folder.
-        folder_selected: str = filedialog.askdirectory(title=f"Select {kind.title()} Folder")
+        Returns
+        -------
+        str | None
+            The chosen folder, or None if the user canceled the dialog.
+        """
+        # Starting in the last chosen folder saves navigating (and listing) the whole path again.
+        folder_selected: str = filedialog.askdirectory(title=title, initialdir=self._last_browse_dir)
 
-        # Do nothing if the user canceled the dialog.
         if not folder_selected:
-            return  # User canceled the dialog.
+            return None  # User canceled the dialog.
+        self._last_browse_dir = folder_selected
+        return folder_selected
+
+    def _browse_source(self) -> None:
+        """Handle the event when the browse button of the source folder is pressed."""
+        folder_selected: str | None = self._ask_folder(title="Select Source Folder")
+        if folder_selected is None:
+            return  # Do nothing if the user canceled the dialog.
 
-        # Add the folder to the appropriate entry field.
-        entry: tk.Entry = self._source_entry if kind == "source" else self._destination_entry
-        entry.delete(first=0, last=tk.END)
-        entry.insert(index=0, string=folder_selected)
+        self._source_var.set(folder_selected)
+        self._fill_destination_field_based_on_source_field()
 
-        if kind == "source":
-            self._fill_destination_field_based_on_source_field()
+    def _browse_destination(self) -> None:
+        """Handle the event when the browse button of the destination folder is pressed."""
+        folder_selected: str | None = self._ask_folder(title="Select Destination Folder")
+        if folder_selected is None:
+            return  # Do nothing if the user canceled the dialog.
+
+        self._destination_var.set(folder_selected)
 
     def _show_about(self) -> None:
         """Show the dialog 'About'."""
@@ -335,8 +511,25 @@ class MainView:
                                     f"For the source code, visit GitHub: https://github.com/sevbogae/DicomSorter.git"
                             )
 
+    def _quit(self) -> None:
+        """Stop the application."""
+        self._running = False
+
+    async def _main_async(self) -> None:
+        """Process the Tk events on an asyncio event loop, until the application is stopped."""
+        self._running = True
+        while self._running:
+            self._root.update()
+            await asyncio.sleep(UPDATE_INTERVAL)
+
+        # Stop a running sort (or its dialog) while its widgets still exist.
+        if self._sorting_task is not None and not self._sorting_task.done():
+            self._sorting_task.cancel()
+            await asyncio.gather(self._sorting_task, return_exceptions=True)
+        self._root.destroy()
+
     def run(self) -> None:
-        self._root.mainloop()
+        asyncio.run(self._main_async())
 
 
 if __name__ == "__main__":
@@ -19,11 +19,12 @@ class SettingsView:
         return self._window
 
     def _create_notebook(self) -> None:
+        # Keep the window hidden while it is built, so its layout is computed once instead of after every widget.
+        self._window.withdraw()
+
         # Some window settings.
         self._window.title("Settings")
         self._window.transient(self._master)
-        self._window.grab_set()  # Make the settings window modal.
-        self._window.focus_force()  # Focus on the settings window.
 
         # Position the window in the center of the parent window.
         x = self._master.winfo_x() + (self._master.winfo_width() // 2) - (self._window.winfo_reqwidth() // 2)
@@ -43,6 +44,12 @@ class SettingsView:
         # When the window is closed, save the settings.
         self._window.protocol(name="WM_DELETE_WINDOW", func=self._on_close)
 
+        # Lay out all widgets in one go, then show the window.
+        self._window.update_idletasks()
+        self._window.deiconify()
+        self._window.grab_set()  # Make the settings window modal. Only possible once the window is shown.
+        self._window.focus_force()  # Focus on the settings window.
+
     def _create_general_settings(self, master: ttk.Frame) -> None:
         # Add a checkbox for enabling or disabling the common dicom tags buttons.
         tags_button_frame = ttk.LabelFrame(master=master, text="DICOM Tags Hints")
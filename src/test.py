@@ -41,29 +41,47 @@ if __name__ == "__main__":
 
 r"""
 
+import concurrent.futures
+import os
+import shutil
+
+import pydicom
+
+# replace all of these symbols with an underscore, in one pass over the text
+CLEAN_TABLE = str.maketrans(dict.fromkeys('*.,"\\/|[]:; ', "_"))
+
 def clean_text(string):
     # clean and standardize text descriptions, which makes searching files easier
-    forbidden_symbols = ["*", ".", ",", "\"", "\\", "/", "|", "[", "]", ":", ";", " "]
-    for symbol in forbidden_symbols:
-        string = string.replace(symbol, "_") # replace everything with an underscore
-    return string.lower()
+    return string.translate(CLEAN_TABLE).lower()
 
 # user specified parameters ----- HIER ABSOLUUT PAD INVULLEN, vergeet de dubbele slashes niet
 src = r"C:\Users\sevbogae\OneDrive - UGent\Documents\QCC\2026\2026-02-16_CT\QCCIQ\UNKNOWN\13394"
 dst = r"C:\Users\sevbogae\OneDrive - UGent\Documents\QCC\2026\2026-02-16_CT"
 
-print('reading file list...')
-unsortedList = []
-for root, dirs, files in os.walk(src):
-    for file in files:
-        #if ".dcm" in file:# exclude non-dicoms, good for messy folders
-            unsortedList.append(os.path.join(root, file))
+def iter_files(folder):
+    # scandir gives the file type with the directory listing, so no extra stat is needed per file
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path)
+            elif entry.is_file():
+                #if ".dcm" in entry.name:# exclude non-dicoms, good for messy folders
+                    yield entry.path
+
+# the only tags needed to sort a file, so the pixel data never has to be read
+sortTags = ["PatientID", "StudyDate", "StudyDescription", "SeriesDescription", "SliceThickness", "ConvolutionKernel",
+            "KVP", "Modality", "StudyInstanceUID", "SeriesInstanceUID", "InstanceNumber"]
 
-print('%s files found.' % len(unsortedList))
+def plan(dicom_loc):
+    # read the header of the file, and work out where it goes; runs in a worker process
 
-for dicom_loc in unsortedList:
-    # read the file
-    ds = pydicom.dcmread(dicom_loc, force=True)
+    # skip non-dicoms (images, pdfs, ...) without parsing them: a dicom has "DICM" after its 128-byte preamble.
+    # files named .dcm are still tried without it, for the rare dicoms that lack the preamble.
+    with open(dicom_loc, "rb") as f:
+        if f.read(132)[128:] != b"DICM" and not dicom_loc.lower().endswith(".dcm"):
+            return None
+
+    ds = pydicom.dcmread(dicom_loc, stop_before_pixels=True, specific_tags=sortTags, force=True)
 
     # get patient, study, and series information
     patientID = clean_text(ds.get("PatientID", "NA"))
@@ -81,27 +99,46 @@ for dicom_loc in unsortedList:
     instanceNumber = str(ds.get("InstanceNumber","0"))
     fileName = modality + "." + instanceNumber + str(KVP) + "_" + str(sliceThickness) + "_" + convKernel + ".dcm"
 
-    # uncompress files (using the gdcm package)
-    try:
-        ds.decompress()
-    except:
-        print('an instance in file %s - %s - %s - %s" could not be decompressed. exiting.' % (patientID, studyDate, studyDescription, seriesDescription ))
+    # 4-tier nested folder structure
+    targetDir = os.path.join(dst, patientID, studyDate, str(KVP), str(sliceThickness), convKernel)
+    compressed = "TransferSyntaxUID" in ds.file_meta and ds.file_meta.TransferSyntaxUID.is_compressed
+    description = (patientID, studyDate, studyDescription, seriesDescription, str(KVP), str(sliceThickness), convKernel)
+    return dicom_loc, targetDir, fileName, compressed, description
+
+# call main() from the if __name__ == "__main__": block above, the worker processes import this module again
+def main():
+    print('reading file list...')
+    unsortedList = list(iter_files(src))
+
+    print('%s files found.' % len(unsortedList))
+
+    # the headers are read in parallel; the folders and files are written here, so no two processes create a folder
+    with concurrent.futures.ProcessPoolExecutor() as ex:
+        plans = [p for p in ex.map(plan, unsortedList, chunksize=64) if p is not None]
 
-    # save files to a 4-tier nested folder structure
-    if not os.path.exists(os.path.join(dst, patientID)):
-        os.makedirs(os.path.join(dst, patientID))
+    print('%s dicom files found.' % len(plans))
 
-    if not os.path.exists(os.path.join(dst, patientID, studyDate, str(KVP))):
-        os.makedirs(os.path.join(dst, patientID, studyDate, str(KVP)))
+    madeDirs = set() # folders already created, so they are not checked again for every file
 
-    if not os.path.exists(os.path.join(dst, patientID, studyDate, str(KVP), str(sliceThickness))):
-        os.makedirs(os.path.join(dst, patientID, studyDate, str(KVP), str(sliceThickness)))
+    for dicom_loc, targetDir, fileName, compressed, description in plans:
+        patientID, studyDate, studyDescription, seriesDescription, KVP, sliceThickness, convKernel = description
 
-    if not os.path.exists(os.path.join(dst, patientID, studyDate, str(KVP), str(sliceThickness), convKernel)):
-        os.makedirs(os.path.join(dst, patientID, studyDate, str(KVP), str(sliceThickness), convKernel))
-        print('Saving out file: %s - %s - %s - %s.' % (patientID, str(KVP), str(sliceThickness), convKernel))
+        # save files to a 4-tier nested folder structure, creating each folder only once
+        if targetDir not in madeDirs:
+            os.makedirs(targetDir, exist_ok=True)
+            madeDirs.add(targetDir)
+            print('Saving out file: %s - %s - %s - %s.' % (patientID, KVP, sliceThickness, convKernel))
 
-    ds.save_as(os.path.join(dst, patientID, studyDate, str(KVP), str(sliceThickness), convKernel, fileName))
+        # uncompress files (using the gdcm package), which needs the whole file; other files are copied as they are
+        if compressed:
+            ds = pydicom.dcmread(dicom_loc, force=True)
+            try:
+                ds.decompress()
+            except:
+                print('an instance in file %s - %s - %s - %s" could not be decompressed. exiting.' % (patientID, studyDate, studyDescription, seriesDescription ))
+            ds.save_as(os.path.join(targetDir, fileName))
+        else:
+            shutil.copyfile(dicom_loc, os.path.join(targetDir, fileName))
 
-print('done.')
+    print('done.')
 """
\ No newline at end of file